@@ -5,14 +5,37 @@ Scans target accounts hourly and posts highlights to Telegram.
 """
 
 import os
+import re
 import json
 import time
 import logging
 import hashlib
+import functools
 import argparse
+import threading
+import itertools
 import requests
-from datetime import datetime
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    from lxml import etree
+except ImportError:  # Same iterparse API, just slower
+    import xml.etree.ElementTree as etree
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # Stdlib json, producing the same compact bytes
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+    _loads = json.loads
 
 # Configure logging
 logging.basicConfig(
@@ -32,24 +55,164 @@ TARGET_ACCOUNTS = [
     "JupiterExchange",  # Jupiter aggregator
 ]
 
+# Public Nitter instances, raced against each other on every fetch
+NITTER_INSTANCES = [
+    "https://nitter.poast.org",
+    "https://nitter.privacydev.net",
+]
+NITTER_MAX_FAILURES = 3  # Consecutive failures before an instance is sidelined
+NITTER_COOLDOWN = 6 * 3600  # Seconds a sidelined instance sits out before a retry
+
+# Patterns used when scraping tweet text out of feeds and HTML
+_TAG_RE = re.compile(r'<[^>]+>')
+_TWSTALKER_RE = re.compile(
+    r'<div[^>]*class="[^"]*tweet-content[^"]*"[^>]*>(.*?)</div>',
+    re.DOTALL | re.IGNORECASE
+)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_URL_QUERY_RE = re.compile(r'(https?://[^\s?#]+)[?#]\S*')
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+MAX_FEED_ITEMS = 10  # Only the newest items of each feed are used
+
 # State file for deduplication
 STATE_FILE = Path("/data/x-monitor-state.json") if Path("/data").exists() else Path.home() / ".openclaw/skills/x-monitor/state.json"
+MAX_SEEN_HASHES = 1000  # Dedup history kept in the state file
+_STATE_DIR_READY = False
+
+MAX_RETRY_AFTER = 30  # Longest Retry-After we're willing to sleep through
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After, but never waits longer than MAX_RETRY_AFTER."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+# Shared HTTP session so repeated calls to the same host reuse pooled connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=_CappedRetry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,  # hand the final response back to the status checks below
+    ),
+))
+
+# The Cerebras/Telegram POSTs aren't idempotent: only retry when the request
+# never reached the server, or was rejected unprocessed with 429/503
+_POST_RETRY = _CappedRetry(
+    total=3,
+    connect=3,
+    read=0,
+    other=0,
+    backoff_factor=1.0,
+    status_forcelist=[429, 503],
+    allowed_methods=frozenset(["POST"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+for _api_prefix in ("https://api.cerebras.ai/", "https://api.telegram.org/"):
+    SESSION.mount(_api_prefix, HTTPAdapter(max_retries=_POST_RETRY))
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (compatible; DEXY-Monitor/1.0)"
+})
+
+# Concurrency limits for the per-account fan-out
+MAX_CONCURRENT_ACCOUNTS = 6
+MAX_REQUESTS_PER_HOST = 4
+ACCOUNT_TIMEOUT = 20  # Upper bound on wall time spent per account
+HOST_MIN_INTERVAL = 1.5  # Minimum seconds between request starts to one host
+
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_next_start: dict[str, float] = {}
+_host_slots_lock = threading.Lock()
+
+# Per Nitter instance: (consecutive failures, monotonic time of last failure)
+_instance_health: dict[str, tuple[int, float]] = {}
+_instance_health_lock = threading.Lock()
+
+
+def _host_slot(host: str) -> threading.BoundedSemaphore:
+    """Get the semaphore bounding concurrent requests to a host."""
+    with _host_slots_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+        return _host_slots[host]
+
+
+def _wait_for_host_token(host: str):
+    """Block until the host's next request slot, keeping HOST_MIN_INTERVAL spacing."""
+    with _host_slots_lock:
+        now = time.monotonic()
+        start = max(now, _host_next_start.get(host, 0.0))
+        _host_next_start[host] = start + HOST_MIN_INTERVAL
+    if start > now:
+        time.sleep(start - now)
+
+
+def _http_get(url: str, **kwargs) -> requests.Response:
+    """GET via the shared session, limited and paced per host."""
+    host = urlsplit(url).netloc
+    with _host_slot(host):
+        _wait_for_host_token(host)
+        return SESSION.get(url, **kwargs)
+
+
+def _error_body(resp: requests.Response) -> str:
+    """First 500 bytes of a response body, for error logs."""
+    return resp.content[:500].decode('utf-8', errors='replace')
 
 
 def load_state() -> dict:
     """Load seen tweets state."""
+    state = {"seen_hashes": [], "last_scan": None}
     if STATE_FILE.exists():
         try:
-            return json.loads(STATE_FILE.read_text())
+            state = _loads(STATE_FILE.read_bytes())
         except:
-            return {"seen_hashes": [], "last_scan": None}
-    return {"seen_hashes": [], "last_scan": None}
+            pass
+    # Bounded history: the oldest hashes fall off as new ones are appended
+    state["seen_hashes"] = deque(state.get("seen_hashes", []), maxlen=MAX_SEEN_HASHES)
+    return state
 
 
 def save_state(state: dict):
     """Save state to file."""
-    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    STATE_FILE.write_text(json.dumps(state, indent=2))
+    global _STATE_DIR_READY
+    if not _STATE_DIR_READY:
+        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _STATE_DIR_READY = True
+    # Write a temp file and swap it in, so a kill mid-write can't truncate the state
+    tmp = STATE_FILE.with_suffix('.tmp')
+    tmp.write_bytes(_dumps({**state, "seen_hashes": list(state["seen_hashes"])}))
+    os.replace(tmp, STATE_FILE)
+
+
+def _iter_feed_items(source, tag: str):
+    """Stream up to MAX_FEED_ITEMS `tag` elements out of an RSS/Atom document.
+    
+    Stops reading `source` as soon as the last wanted item has been parsed.
+    """
+    count = 0
+    for _, elem in etree.iterparse(source, events=("end",)):
+        if elem.tag != tag:
+            continue
+        yield elem
+        elem.clear()  # Drop the item's subtree once the caller is done with it
+        count += 1
+        if count >= MAX_FEED_ITEMS:
+            break
 
 
 def fetch_via_rss_bridge(account: str) -> list[dict]:
@@ -63,37 +226,29 @@ def fetch_via_rss_bridge(account: str) -> list[dict]:
     
     for url in bridges:
         try:
-            resp = requests.get(url, timeout=20, headers={
-                "User-Agent": "Mozilla/5.0 (compatible; DEXY-Monitor/1.0)"
-            })
-            
-            if resp.status_code == 200 and '<entry>' in resp.text:
-                import xml.etree.ElementTree as ET
-                
-                # Parse Atom feed
-                root = ET.fromstring(resp.text)
-                ns = {'atom': 'http://www.w3.org/2005/Atom'}
-                
-                for entry in root.findall('.//atom:entry', ns)[:10]:
-                    title = entry.find('atom:title', ns)
-                    link = entry.find('atom:link', ns)
-                    content = entry.find('atom:content', ns)
-                    published = entry.find('atom:published', ns)
-                    
-                    text = ""
-                    if content is not None and content.text:
-                        import re
-                        text = re.sub(r'<[^>]+>', '', content.text).strip()
-                    elif title is not None and title.text:
-                        text = title.text
-                    
-                    if text and len(text) > 20:
-                        tweets.append({
-                            "author": f"@{account}",
-                            "text": text[:1000],
-                            "url": link.get('href') if link is not None else "",
-                            "timestamp": published.text if published is not None else "",
-                        })
+            with _http_get(url, timeout=20, stream=True) as resp:
+                if resp.status_code == 200:
+                    # Parse the Atom feed straight off the socket
+                    resp.raw.decode_content = True
+                    for entry in _iter_feed_items(resp.raw, f"{_ATOM}entry"):
+                        title = entry.find(f"{_ATOM}title")
+                        link = entry.find(f"{_ATOM}link")
+                        content = entry.find(f"{_ATOM}content")
+                        published = entry.find(f"{_ATOM}published")
+                        
+                        text = ""
+                        if content is not None and content.text:
+                            text = _TAG_RE.sub('', content.text).strip()
+                        elif title is not None and title.text:
+                            text = title.text
+                        
+                        if text and len(text) > 20:
+                            tweets.append({
+                                "author": f"@{account}",
+                                "text": text[:1000],
+                                "url": link.get('href') if link is not None else "",
+                                "timestamp": published.text if published is not None else "",
+                            })
                 
                 if tweets:
                     logger.info(f"Fetched {len(tweets)} tweets from @{account} via RSS-Bridge")
@@ -106,56 +261,96 @@ def fetch_via_rss_bridge(account: str) -> list[dict]:
     return tweets
 
 
-def fetch_via_nitter(account: str) -> list[dict]:
-    """Fetch tweets via Nitter instances."""
+def _fetch_nitter_instance(instance: str, account: str) -> list[dict]:
+    """Fetch an account's RSS feed from a single Nitter instance."""
     tweets = []
     
-    nitter_instances = [
-        "https://nitter.poast.org",
-        "https://nitter.privacydev.net",
-    ]
-    
-    for instance in nitter_instances:
-        try:
-            url = f"{instance}/{account}/rss"
-            resp = requests.get(url, timeout=15, headers={
-                "User-Agent": "Mozilla/5.0 (compatible; DEXY-Monitor/1.0)"
-            })
+    url = f"{instance}/{account}/rss"
+    with _http_get(url, timeout=15, stream=True) as resp:
+        resp.raise_for_status()
+        
+        # Parse the RSS feed straight off the socket
+        resp.raw.decode_content = True
+        for item in _iter_feed_items(resp.raw, "item"):
+            title = item.find("title")
+            link = item.find("link")
+            description = item.find("description")
+            pub_date = item.find("pubDate")
             
-            if resp.status_code == 200 and '<item>' in resp.text:
-                import xml.etree.ElementTree as ET
-                root = ET.fromstring(resp.text)
-                
-                for item in root.findall(".//item")[:10]:
-                    title = item.find("title")
-                    link = item.find("link")
-                    description = item.find("description")
-                    pub_date = item.find("pubDate")
-                    
-                    text = ""
-                    if description is not None and description.text:
-                        import re
-                        text = re.sub(r'<[^>]+>', '', description.text).strip()
-                    elif title is not None and title.text:
-                        text = title.text
-                    
-                    if text and len(text) > 20:
-                        tweets.append({
-                            "author": f"@{account}",
-                            "text": text[:1000],
-                            "url": link.text if link is not None else "",
-                            "timestamp": pub_date.text if pub_date is not None else "",
-                        })
-                
+            text = ""
+            if description is not None and description.text:
+                text = _TAG_RE.sub('', description.text).strip()
+            elif title is not None and title.text:
+                text = title.text
+            
+            if text and len(text) > 20:
+                tweets.append({
+                    "author": f"@{account}",
+                    "text": text[:1000],
+                    "url": link.text if link is not None else "",
+                    "timestamp": pub_date.text if pub_date is not None else "",
+                })
+    
+    return tweets
+
+
+def _record_instance_result(instance: str, ok: bool):
+    """Update the failure streak for a Nitter instance."""
+    with _instance_health_lock:
+        if ok:
+            _instance_health.pop(instance, None)
+        else:
+            failures, _ = _instance_health.get(instance, (0, 0.0))
+            _instance_health[instance] = (failures + 1, time.monotonic())
+
+
+def _record_instance_outcome(instance: str, account: str, future):
+    """Done-callback recording how a raced Nitter fetch ended, even after the race is decided."""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.debug(f"Nitter {instance} failed for @{account}: {error}")
+    _record_instance_result(instance, ok=error is None)
+
+
+def _instance_is_healthy(instance: str) -> bool:
+    """Check whether a Nitter instance is out of its cooldown."""
+    failures, last_failure = _instance_health.get(instance, (0, 0.0))
+    return failures < NITTER_MAX_FAILURES or time.monotonic() - last_failure > NITTER_COOLDOWN
+
+
+def fetch_via_nitter(account: str) -> list[dict]:
+    """Fetch tweets via Nitter, racing all healthy instances."""
+    with _instance_health_lock:
+        instances = [inst for inst in NITTER_INSTANCES if _instance_is_healthy(inst)]
+    # If every instance is sidelined, give them all another chance
+    instances = instances or NITTER_INSTANCES
+    
+    pool = ThreadPoolExecutor(max_workers=len(instances))
+    pending = set()
+    for instance in instances:
+        future = pool.submit(_fetch_nitter_instance, instance, account)
+        # Health is recorded per future, so instances still running when a
+        # winner returns are counted once they finish
+        future.add_done_callback(functools.partial(_record_instance_outcome, instance, account))
+        pending.add(future)
+    
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    continue
+                tweets = future.result()
                 if tweets:
                     logger.info(f"Fetched {len(tweets)} tweets from @{account} via Nitter")
                     return tweets
-                    
-        except Exception as e:
-            logger.debug(f"Nitter failed for @{account}: {e}")
-            continue
+    finally:
+        # Let the losers finish (one worker each) so their health still gets recorded
+        pool.shutdown(wait=False)
     
-    return tweets
+    return []
 
 
 def fetch_via_twstalker(account: str) -> list[dict]:
@@ -164,22 +359,17 @@ def fetch_via_twstalker(account: str) -> list[dict]:
     
     try:
         url = f"https://twstalker.com/{account}"
-        resp = requests.get(url, timeout=15, headers={
+        resp = _http_get(url, timeout=15, headers={
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept": "text/html",
         })
         
         if resp.status_code == 200:
-            import re
-            
             # Extract tweet content from twstalker HTML
-            tweet_pattern = re.compile(
-                r'<div[^>]*class="[^"]*tweet-content[^"]*"[^>]*>(.*?)</div>',
-                re.DOTALL | re.IGNORECASE
-            )
-            
-            for match in tweet_pattern.finditer(resp.text)[:10]:
-                text = re.sub(r'<[^>]+>', '', match.group(1)).strip()
+            # Decode explicitly; resp.text would run charset detection on every page
+            html = resp.content.decode('utf-8', errors='replace')
+            for match in itertools.islice(_TWSTALKER_RE.finditer(html), 10):
+                text = _TAG_RE.sub('', match.group(1)).strip()
                 if text and len(text) > 20:
                     tweets.append({
                         "author": f"@{account}",
@@ -197,31 +387,50 @@ def fetch_via_twstalker(account: str) -> list[dict]:
     return tweets
 
 
+def fetch_account(account: str) -> list[dict]:
+    """Fetch tweets for one account, racing all methods and keeping the first hit."""
+    methods = [fetch_via_rss_bridge, fetch_via_nitter, fetch_via_twstalker]
+    pool = ThreadPoolExecutor(max_workers=len(methods))
+    futures = [pool.submit(method, account) for method in methods]
+    
+    try:
+        for future in as_completed(futures, timeout=ACCOUNT_TIMEOUT):
+            tweets = future.result()
+            if tweets:
+                return tweets
+    except TimeoutError:
+        logger.warning(f"Timed out fetching tweets for @{account}")
+        return []
+    finally:
+        # Don't wait on the losing methods; they finish under their own timeouts
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    logger.warning(f"Could not fetch tweets for @{account}")
+    return []
+
+
 def fetch_all_tweets() -> list[dict]:
-    """Fetch tweets from all target accounts using multiple methods."""
+    """Fetch tweets from all target accounts concurrently."""
     all_tweets = []
     
-    for account in TARGET_ACCOUNTS:
-        tweets = []
-        
-        # Try methods in order of reliability
-        for fetch_method in [fetch_via_rss_bridge, fetch_via_nitter, fetch_via_twstalker]:
-            tweets = fetch_method(account)
-            if tweets:
-                break
-        
-        if tweets:
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_ACCOUNTS) as pool:
+        for tweets in pool.map(fetch_account, TARGET_ACCOUNTS):
             all_tweets.extend(tweets)
-        else:
-            logger.warning(f"Could not fetch tweets for @{account}")
-        
-        time.sleep(2)  # Rate limiting
     
     return all_tweets
 
 
-def analyze_with_cerebras(tweets: list[dict]) -> str:
-    """Send tweets to Cerebras for highlight extraction."""
+# Credentials, cached once found; a miss is retried on the next lookup
+_cached_cerebras_key: str | None = None
+_cached_telegram_token: str | None = None
+
+
+def _cerebras_key() -> str | None:
+    """Look up the Cerebras API key, reading config only until it's found."""
+    global _cached_cerebras_key
+    if _cached_cerebras_key:
+        return _cached_cerebras_key
+    
     api_key = os.environ.get("CEREBRAS_API_KEY")
     if not api_key:
         config_path = Path.home() / ".config/cerebras/config"
@@ -231,21 +440,34 @@ def analyze_with_cerebras(tweets: list[dict]) -> str:
                     api_key = line.split("=", 1)[1].strip('"\'')
                     break
     
-    if not api_key:
-        logger.error("No Cerebras API key found")
-        return ""
-    
-    # Format tweets for analysis
-    tweet_text = "\n\n".join([
-        f"{t.get('author', '?')}: {t.get('text', '')}"
-        for t in tweets[:20]
-    ])
+    if api_key:
+        _cached_cerebras_key = api_key
+    return api_key
+
+
+def _telegram_token() -> str | None:
+    """Look up the Telegram bot token, reading config only until it's found."""
+    global _cached_telegram_token
+    if _cached_telegram_token:
+        return _cached_telegram_token
     
-    if len(tweet_text) < 100:
-        logger.warning("Not enough tweet content to analyze")
-        return "No major highlights this hour."
+    bot_token = os.environ.get("TELEGRAM_BOT_TOKEN")
+    if not bot_token:
+        try:
+            config_path = Path.home() / ".openclaw/openclaw.json"
+            if config_path.exists():
+                config = json.loads(config_path.read_text())
+                bot_token = config.get("channels", {}).get("telegram", {}).get("token")
+        except:
+            pass
     
-    prompt = f"""Analyze these recent crypto/Solana tweets and extract the most important highlights.
+    if bot_token:
+        _cached_telegram_token = bot_token
+    return bot_token
+
+
+# Static parts of the Cerebras prompt; only the tweet block changes per scan
+_CEREBRAS_PROMPT_HEADER = """Analyze these recent crypto/Solana tweets and extract the most important highlights.
 
 Focus on:
 1. New token launches or announcements
@@ -254,16 +476,35 @@ Focus on:
 4. Notable alpha or trading insights
 5. Partnerships or integrations
 
-Tweets:
-{tweet_text}
+Tweets:"""
 
-Provide a concise summary (max 5 bullet points) of the most important/actionable information. 
+_CEREBRAS_PROMPT_FOOTER = """Provide a concise summary (max 5 bullet points) of the most important/actionable information. 
 Use emojis for visual appeal. Format for Telegram (markdown).
 If nothing significant, say "No major highlights this hour."
 """
 
+
+def analyze_with_cerebras(tweets: list[dict]) -> str:
+    """Send tweets to Cerebras for highlight extraction."""
+    api_key = _cerebras_key()
+    if not api_key:
+        logger.error("No Cerebras API key found")
+        return ""
+    
+    # Format tweets for analysis
+    tweet_text = "\n\n".join([
+        f"{t.get('author', '?')}: {t.get('text', '')}"
+        for t in tweets[:20]
+    ])
+    
+    if len(tweet_text) < 100:
+        logger.warning("Not enough tweet content to analyze")
+        return "No major highlights this hour."
+    
+    prompt = f"{_CEREBRAS_PROMPT_HEADER}\n{tweet_text}\n\n{_CEREBRAS_PROMPT_FOOTER}"
+
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             "https://api.cerebras.ai/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -283,7 +524,7 @@ If nothing significant, say "No major highlights this hour."
             msg = data["choices"][0]["message"]
             return msg.get("content") or msg.get("reasoning") or ""
         else:
-            logger.error(f"Cerebras API error: {resp.status_code} - {resp.text}")
+            logger.error(f"Cerebras API error: {resp.status_code} - {_error_body(resp)}")
             return ""
             
     except Exception as e:
@@ -293,26 +534,16 @@ If nothing significant, say "No major highlights this hour."
 
 def send_to_telegram(message: str, chat_id: str = "-5223082150"):
     """Send message to Telegram group."""
-    bot_token = os.environ.get("TELEGRAM_BOT_TOKEN")
-    
-    if not bot_token:
-        try:
-            config_path = Path.home() / ".openclaw/openclaw.json"
-            if config_path.exists():
-                config = json.loads(config_path.read_text())
-                bot_token = config.get("channels", {}).get("telegram", {}).get("token")
-        except:
-            pass
-    
+    bot_token = _telegram_token()
     if not bot_token:
         logger.error("No Telegram bot token found")
         return False
     
     try:
         url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        resp = requests.post(url, json={
+        resp = SESSION.post(url, json={
             "chat_id": chat_id,
-            "text": f"🔍 *X Monitor Scan*\n_{datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}_\n\n{message}",
+            "text": f"🔍 *X Monitor Scan*\n_{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}_\n\n{message}",
             "parse_mode": "Markdown",
         }, timeout=30)
         
@@ -320,7 +551,7 @@ def send_to_telegram(message: str, chat_id: str = "-5223082150"):
             logger.info("Successfully posted to Telegram")
             return True
         else:
-            logger.error(f"Telegram API error: {resp.status_code} - {resp.text}")
+            logger.error(f"Telegram API error: {resp.status_code} - {_error_body(resp)}")
             return False
             
     except Exception as e:
@@ -328,6 +559,13 @@ def send_to_telegram(message: str, chat_id: str = "-5223082150"):
         return False
 
 
+def _dedup_key(text: str) -> str:
+    """Hash a tweet's normalized text so the same tweet from different sources matches."""
+    normalized = _URL_QUERY_RE.sub(r'\1', text.strip().lower())
+    normalized = _WHITESPACE_RE.sub(' ', normalized)[:120]
+    return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+
+
 def run_scan(force_post: bool = False):
     """Run a single scan cycle."""
     logger.info("Starting X monitor scan...")
@@ -342,32 +580,52 @@ def run_scan(force_post: bool = False):
     
     # Deduplicate
     new_tweets = []
+    seen = set(state["seen_hashes"])
+    # State written before the switch to blake2b still holds 32-char MD5 keys
+    check_legacy = any(len(h) == 32 for h in seen)
     for tweet in tweets:
-        tweet_hash = hashlib.md5(tweet.get("text", "")[:100].encode()).hexdigest()
-        if tweet_hash not in state.get("seen_hashes", []):
-            new_tweets.append(tweet)
-            state.setdefault("seen_hashes", []).append(tweet_hash)
+        text = tweet.get("text", "")
+        tweet_hash = _dedup_key(text)
+        if tweet_hash in seen:
+            continue
+        if check_legacy and hashlib.md5(text[:100].encode()).hexdigest() in seen:
+            continue
+        seen.add(tweet_hash)
+        new_tweets.append(tweet)
+        state["seen_hashes"].append(tweet_hash)
     
-    state["seen_hashes"] = state["seen_hashes"][-500:]
     logger.info(f"Found {len(new_tweets)} new tweets")
     
+    # Persist dedup progress before the slow analysis/post steps, so a restart
+    # mid-scan doesn't re-send the same batch
+    state["last_scan"] = datetime.now(timezone.utc).isoformat()
+    save_state(state)
+    
     if not new_tweets and not force_post:
         logger.info("No new tweets, skipping analysis")
-        state["last_scan"] = datetime.utcnow().isoformat()
-        save_state(state)
+        return
+    
+    # Forced re-runs over an unchanged feed would re-send the same batch to Cerebras
+    batch = new_tweets if new_tweets else tweets
+    batch_hash = hashlib.blake2b(
+        "".join(t.get("text", "") for t in batch).encode(), digest_size=8
+    ).hexdigest()
+    if state.get("last_batch_hash") == batch_hash:
+        logger.info("Batch already analyzed, skipping analysis")
         return
     
     # Analyze with Cerebras
-    analysis = analyze_with_cerebras(new_tweets if new_tweets else tweets)
+    analysis = analyze_with_cerebras(batch)
     logger.info(f"Analysis result: {analysis[:200] if analysis else 'EMPTY'}...")
     
+    if analysis:
+        state["last_batch_hash"] = batch_hash
+        save_state(state)
+    
     if analysis and "No major highlights" not in analysis and len(analysis) > 50:
         send_to_telegram(analysis)
     else:
         logger.info("No significant highlights to post")
-    
-    state["last_scan"] = datetime.utcnow().isoformat()
-    save_state(state)
 
 
 def main():
@@ -382,13 +640,16 @@ def main():
     else:
         logger.info(f"Starting X monitor service (interval: {args.interval}s)")
         while True:
+            # Schedule from the scan's start so slow scans don't push the cadence back
+            next_run = time.monotonic() + args.interval
             try:
                 run_scan()
             except Exception as e:
                 logger.error(f"Scan failed: {e}")
             
-            logger.info(f"Sleeping for {args.interval}s...")
-            time.sleep(args.interval)
+            delay = max(0, next_run - time.monotonic())
+            logger.info(f"Sleeping for {delay:.0f}s...")
+            time.sleep(delay)
 
 
 if __name__ == "__main__":